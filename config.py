@@ -8,4 +8,8 @@ DATABASE_CONFIG = {
 
 # App Configuration
 SECRET_KEY = "empowerhub-secret-key-2025-change-in-production"
-DEBUG = True
\ No newline at end of file
+DEBUG = True
+
+# Response compression (flask-compress); small bodies aren't worth compressing
+COMPRESS_ALGORITHM = ['br', 'gzip']
+COMPRESS_MIN_SIZE = 500
\ No newline at end of file
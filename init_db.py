@@ -1,8 +1,10 @@
 # init_db.py
-from app import app
-from extensions import db
+# One-shot schema setup; run once per deploy instead of on app startup
+import sys
+
+from app import init_database
 
 if __name__ == "__main__":
-    with app.app_context():
-        db.create_all()
-        print("✅ All tables created successfully!")
+    if not init_database():
+        sys.exit(1)
+    print("✅ All tables created successfully!")